@@ -2,11 +2,25 @@ import json
 from pathlib import Path
 from typing import Union
 
+# The retry context is identical for every upload, so it only has to be encoded once.
+RETRY_CONTEXT = json.dumps({
+    'num_reupload': 0,
+    'num_step_auto_retry': 0,
+    'num_step_manual_retry': 0,
+})
+XSHARING = json.dumps([])
+# Only the quality differs between uploads, it is substituted into this template by `build_default_rupload_params`.
+COMPRESSION_TMPL = json.dumps({
+    'lib_name': 'moz',
+    'lib_version': '3.1.m',
+    'quality': '%s'
+})
+
 
 def get_image_type(p: Union[str, Path]) -> str:
     """Returns the type of image, i.e. jpeg or png."""
     if isinstance(p, Path):
-        return p.suffix
+        return p.suffix[1:]
     return p.split('.')[-1]
 
 
@@ -15,15 +29,7 @@ def build_default_rupload_params(obj, quality: int) -> dict:
     return {
         'upload_id': obj.upload_id,
         'media_type': 1,
-        'retry_context': json.dumps({
-            'num_reupload': 0,
-            'num_step_auto_retry': 0,
-            'num_step_manual_retry': 0,
-        }),
-        'xsharing_user_ids': json.dumps([]),
-        'image_compression': json.dumps({
-            'lib_name': 'moz',
-            'lib_version': '3.1.m',
-            'quality': str(quality)
-        })
+        'retry_context': RETRY_CONTEXT,
+        'xsharing_user_ids': XSHARING,
+        'image_compression': COMPRESSION_TMPL % quality
     }
\ No newline at end of file
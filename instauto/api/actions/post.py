@@ -1,15 +1,17 @@
 import json
 import hmac
+import threading
 
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
 from requests import Session, Response
-from typing import Callable, Union
+from typing import Callable, Union, List, Dict
 from instauto.api.actions.stubs import _request
 
 from ..structs import Method, State, DeviceProfile, IGProfile, PostLocation
 from .structs.post import PostFeed, PostStory, Comment, UpdateCaption, Save, Like, Unlike, Device, RetrieveByUser, Location
-from ..exceptions import BadResponse
+from ..exceptions import BadResponse, ChallengeRequired, BulkActionFailed
 
-from .helpers import build_default_rupload_params
+from .helpers import build_default_rupload_params, RETRY_CONTEXT
 
 
 class PostMixin:
@@ -21,22 +23,98 @@ class PostMixin:
     _request: _request
     _gen_uuid: Callable
     _generate_user_breadcrumb: Callable
+    _handle_challenge: Callable
+    _thread_local: threading.local
 
     breadcrumb_private_key: bytes
     bc_hmac: hmac.HMAC
 
+    _FEED_SRC = PostLocation.Feed.value
+    _STORY_SRC = PostLocation.Story.value
+    _SRC_TO_ENDPOINT = {
+        _FEED_SRC: 'media/configure/',
+        _STORY_SRC: 'media/configure_to_story/'
+    }
+
     def _post_act(self, obj: Union[Save, Comment, UpdateCaption, Like, Unlike]):
         """Peforms the actual action and calls the Instagram API with the data provided."""
-        if obj.feed_position is None:
-            delattr(obj, 'feed_position')
+        return self._send_act(obj.fill(self))
 
+    def _send_act(self, obj: Union[Save, Comment, UpdateCaption, Like, Unlike]):
+        """Calls the Instagram API for an action. `obj` should already be filled."""
         endpoint = f'media/{obj.media_id}/{obj.action}/'
-        return self._request(endpoint, Method.POST, data=obj.fill(self).to_dict(), signed=True)
+        return self._request(endpoint, Method.POST, data=obj.to_dict(), signed=True)
 
     def post_like(self, obj: Like) -> Response:
         """Likes a post"""
         return self._post_act(obj)
 
+    def _post_act_in_worker(self, obj: Union[Save, Comment, UpdateCaption, Like, Unlike]):
+        """Same as `_send_act`, but raises challenges instead of handling them, so they can be handled once on the
+        calling thread."""
+        self._thread_local.defer_challenges = True
+        return self._send_act(obj)
+
+    def post_like_many(self, objs: List[Like], max_workers: int = 8) -> List[Response]:
+        """Likes multiple posts concurrently.
+
+        At most `max_workers` requests are in flight at the same time. Keep this number low, Instagram rate limits
+        accounts that send too many requests at once. The objects are filled on the calling thread, but the requests
+        are sent from worker threads over the client's requests.Session, which is shared across them without being
+        guaranteed thread-safe. Don't use the client from other threads while this runs.
+
+        As soon as one of the requests fails, the likes that weren't sent yet are cancelled and `BulkActionFailed`
+        is raised, once the requests that were in flight have finished. Its `responses`, `errors` and `cancelled`
+        attributes tell, by index in `objs`, which likes went through, which failed and which were never sent, so
+        only the latter two have to be retried. If Instagram asked for a challenge, it is handled once on the calling
+        thread before raising.
+
+        Parameters
+        ----------
+        objs : List[Like]
+            The posts to like
+        max_workers : int
+            Maximum amount of requests sent concurrently, defaults to 8.
+        Returns
+        -------
+        List[Response]
+            The responses returned by the Instagram API, in the same order as `objs`.
+
+        Raises
+        -------
+        BulkActionFailed
+            When one or more of the requests failed. The first error is chained as its cause.
+        """
+        # Reading the session's cookies while the workers are sending requests isn't safe, so fill the objects first.
+        objs = [obj.fill(self) for obj in objs]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._post_act_in_worker, obj) for obj in objs]
+            _, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            # Don't keep sending likes once a request failed, e.g. because the account is being rate limited.
+            for future in pending:
+                future.cancel()
+
+        responses: Dict[int, Response] = {}
+        errors: Dict[int, Exception] = {}
+        cancelled: List[int] = []
+        for i, future in enumerate(futures):
+            if future.cancelled():
+                cancelled.append(i)
+            elif future.exception() is not None:
+                errors[i] = future.exception()
+            else:
+                responses[i] = future.result()
+
+        if not errors:
+            return [responses[i] for i in range(len(futures))]
+
+        challenge = next((e for e in errors.values() if isinstance(e, ChallengeRequired)), None)
+        if challenge is not None:
+            self._handle_challenge(challenge.resp)
+        raise BulkActionFailed(
+            responses, errors, cancelled, f"{len(errors)} of {len(objs)} likes failed, {len(cancelled)} were not sent."
+        ) from next(iter(errors.values()))
+
     def post_unlike(self, obj: Unlike) -> Response:
         """Unlikes a post"""
         return self._post_act(obj)
@@ -100,9 +178,11 @@ class PostMixin:
                        int(self.device_profile.android_sdk_version), self.device_profile.android_release)
             obj.device = d
 
+        # The file object is passed as is, so requests streams the image instead of reading it into memory first.
+        # requests sets the Content-Length header itself, from the size of the file.
         with open(path, 'rb') as f:
             self._request(f'https://i.instagram.com/rupload_igphoto/{headers["x-entity-name"]}', Method.POST,
-                          headers=headers, data=f.read())
+                          headers=headers, data=f)
         return as_dict
 
     def post_post(self, obj: Union[PostStory, PostFeed], quality: int = None) -> Response:
@@ -122,14 +202,12 @@ class PostMixin:
             quality = 70
         as_dict = self._upload_image(obj, quality)
         headers = {
-            'retry_context': json.dumps({"num_reupload": 0, "num_step_auto_retry": 0, "num_step_manual_retry": 0})
+            'retry_context': RETRY_CONTEXT
         }
-        if obj.source_type == PostLocation.Feed.value:
-            return self._request('media/configure/', Method.POST, data=as_dict, headers=headers, signed=True)
-        elif obj.source_type == PostLocation.Story.value:
-            return self._request('media/configure_to_story/', Method.POST, data=as_dict, headers=headers, signed=True)
-        else:
-            raise Exception("{} is not a supported post location.", obj.source_type)
+        endpoint = self._SRC_TO_ENDPOINT.get(obj.source_type)
+        if endpoint is None:
+            raise Exception(f"{obj.source_type} is not a supported post location.")
+        return self._request(endpoint, Method.POST, data=as_dict, headers=headers, signed=True)
 
     def post_retrieve_by_user(self, obj: RetrieveByUser) -> (RetrieveByUser, Union[dict, bool]):
         """Retrieves 12 posts of the user at a time. If there was a response / if there were any more posts
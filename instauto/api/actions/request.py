@@ -3,12 +3,14 @@ import time
 import json
 import urllib.parse
 import logging
+import threading
 
-from typing import Dict, Callable, Union
+from typing import Dict, Callable, Union, IO
 
 from instauto.api.structs import DeviceProfile, IGProfile, State, Method
 from instauto.api.constants import API_BASE_URL
-from instauto.api.exceptions import WrongMethodException, IncorrectLoginDetails, InvalidUserId, BadResponse
+from instauto.api.exceptions import WrongMethodException, IncorrectLoginDetails, InvalidUserId, BadResponse, \
+    ChallengeRequired
 
 logger = logging.getLogger(__name__)
 logging.captureWarnings(True)
@@ -22,6 +24,8 @@ class RequestMixin:
     _encrypt_password: Callable
     _session: requests.Session
     _request_finished_callbacks: list
+    _state_lock: threading.RLock
+    _thread_local: threading.local
 
     def _build_user_agent(self) -> str:
         """Builds a user agent, making use from all required values in `self.ig_profile`, `self.device_profile` and
@@ -70,7 +74,7 @@ class RequestMixin:
             'accept-encoding': self.state.accept_encoding,
             'x-fb-http-engine': self.ig_profile.http_engine,
             'authorization': self.state.authorization,
-            'connection': 'close',
+            'connection': 'keep-alive',
             'x-pigeon-session-id': self.state.pigeon_session_id,
             'x-pigeon-rawclienttime': str(round(time.time(), 3)),
             'x-bloks-version-id': self.state.bloks_version_id,
@@ -123,7 +127,7 @@ class RequestMixin:
         public_api_key = headers.get('ig-set-password-encryption-pub-key')
         if public_api_key is not None: self.state.public_api_key = public_api_key; self._encrypt_password()
 
-    def _request(self, endpoint: str, method: Method, query: dict = None, data: Union[dict, bytes] = None, headers: Dict[str, str]
+    def _request(self, endpoint: str, method: Method, query: dict = None, data: Union[dict, bytes, IO[bytes]] = None, headers: Dict[str, str]
     = None, default_headers: bool = None, signed: bool = None) -> requests.Response:
         """Creates and sends a request to the specified endpoint.
 
@@ -136,8 +140,9 @@ class RequestMixin:
             Specifies which method to use for sending the HTTP request.
         query : dict, optional
             A dictionary that contains all key-value pairs that should be added to the final url, as a query string.
-        data : dict, optional
-            A dictionary that contains all key-value pairs that should be send along with a post request.
+        data : dict, bytes or file object, optional
+            A dictionary that contains all key-value pairs that should be send along with a post request. Can also be
+            the raw body, either as bytes or as a file object opened in binary mode. File objects are streamed.
         headers : dict, optional
             A dictionary that contains all key-value pairs of the headers that should be sent along with the HTTP
             request. Header values from this argument take priority over the default headers. Default headers are
@@ -182,7 +187,8 @@ class RequestMixin:
         if query:
             url += f"?{urllib.parse.urlencode(query)}"
         if default_headers:
-            h = self._build_default_headers()
+            with self._state_lock:
+                h = self._build_default_headers()
             h.update(headers)
             headers = h
 
@@ -227,10 +233,11 @@ class RequestMixin:
             f'{"*" * 20} END REQUEST {"*" * 20}'
         )
 
-        self._check_response_for_errors(resp)
+        with self._state_lock:
+            self._check_response_for_errors(resp)
 
-        for func in self._request_finished_callbacks:
-            func(resp.headers)
+            for func in self._request_finished_callbacks:
+                func(resp.headers)
 
         return resp
 
@@ -253,6 +260,8 @@ class RequestMixin:
         if parsed.get('message') in ("checkpoint_required", "challenge_required"):
             if not hasattr(self, '_handle_challenge'):
                 raise BadResponse("Challenge required. ChallengeMixin is not mixed in.")
+            if getattr(self._thread_local, 'defer_challenges', False):
+                raise ChallengeRequired(resp, "Challenge required. It should be handled on the calling thread.")
             eh = self._handle_challenge(resp)
             if eh:
                 return
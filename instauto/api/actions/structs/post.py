@@ -1,4 +1,5 @@
 from . import common as cmmn
+import os
 import uuid
 import random
 import time
@@ -153,9 +154,7 @@ class _PostBase(cmmn.Base):
         self.entity_type = f'image/{image_type}'
         self.image_path = path
 
-        with open(path, 'rb') as f:
-            f.seek(0, 2)
-            self.entity_length = f.tell()
+        self.entity_length = os.path.getsize(path)
 
         if edits is not None and extra is None:
             self.extra = Extra(edits.crop_original_size[0], edits.crop_original_size[1])
@@ -0,0 +1,38 @@
+import json
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from instauto.api.actions.helpers import get_image_type, build_default_rupload_params
+
+
+class TestHelpers(unittest.TestCase):
+    def test_get_image_type_str(self):
+        self.assertEqual(get_image_type('test_feed.jpg'), 'jpg')
+
+    def test_get_image_type_path(self):
+        self.assertEqual(get_image_type(Path('test_feed.jpg')), 'jpg')
+
+    def test_build_default_rupload_params(self):
+        obj = SimpleNamespace(upload_id='1602679200')
+        # The values that were sent before the static parts were precomputed.
+        expected = {
+            'upload_id': '1602679200',
+            'media_type': 1,
+            'retry_context': json.dumps({
+                'num_reupload': 0,
+                'num_step_auto_retry': 0,
+                'num_step_manual_retry': 0,
+            }),
+            'xsharing_user_ids': json.dumps([]),
+            'image_compression': json.dumps({
+                'lib_name': 'moz',
+                'lib_version': '3.1.m',
+                'quality': str(70)
+            })
+        }
+        self.assertEqual(build_default_rupload_params(obj, 70), expected)
+
+    def test_build_default_rupload_params_quality_as_str(self):
+        obj = SimpleNamespace(upload_id='1602679200')
+        self.assertEqual(build_default_rupload_params(obj, '70'), build_default_rupload_params(obj, 70))
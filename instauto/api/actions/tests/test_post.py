@@ -0,0 +1,133 @@
+import json
+import time
+import random
+import threading
+import unittest
+import unittest.mock
+
+from requests import Response
+
+from instauto.api.client import ApiClient
+from instauto.api.exceptions import ChallengeRequired, BulkActionFailed
+import instauto.api.actions.structs.post as ps
+
+
+class TestPostLikeMany(unittest.TestCase):
+    def test_order(self):
+        client = ApiClient(testing=True)
+
+        def request(endpoint, *args, **kwargs):
+            time.sleep(random.uniform(0, 0.01))
+            return endpoint
+
+        client._request = unittest.mock.Mock(side_effect=request)
+        media_ids = [str(i) for i in range(20)]
+        responses = client.post_like_many([ps.Like(media_id) for media_id in media_ids], max_workers=4)
+        self.assertEqual(responses, [f'media/{media_id}/like/' for media_id in media_ids])
+
+    def test_max_workers(self):
+        client = ApiClient(testing=True)
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+
+        def request(*args, **kwargs):
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.pop()
+            return Response()
+
+        client._request = unittest.mock.Mock(side_effect=request)
+        client.post_like_many([ps.Like(str(i)) for i in range(20)], max_workers=3)
+        self.assertEqual(client._request.call_count, 20)
+        self.assertLessEqual(max(peak), 3)
+
+    def test_error_stops_remaining(self):
+        client = ApiClient(testing=True)
+
+        def request(endpoint, *args, **kwargs):
+            if endpoint == 'media/0/like/':
+                raise TimeoutError("Calm down. Please try again in a few minutes.")
+            time.sleep(0.05)
+            return Response()
+
+        client._request = unittest.mock.Mock(side_effect=request)
+        with self.assertRaises(BulkActionFailed) as cm:
+            client.post_like_many([ps.Like(str(i)) for i in range(20)], max_workers=1)
+        self.assertLessEqual(client._request.call_count, 2)
+        self.assertIsInstance(cm.exception.__cause__, TimeoutError)
+        self.assertIsInstance(cm.exception.errors[0], TimeoutError)
+
+    def test_error_reports_outcome_per_like(self):
+        client = ApiClient(testing=True)
+        lock = threading.Lock()
+        sent = []
+
+        def request(endpoint, *args, **kwargs):
+            with lock:
+                sent.append(int(endpoint.split('/')[1]))
+            if endpoint == 'media/5/like/':
+                raise TimeoutError("Calm down. Please try again in a few minutes.")
+            time.sleep(0.01)
+            return endpoint
+
+        client._request = unittest.mock.Mock(side_effect=request)
+        with self.assertRaises(BulkActionFailed) as cm:
+            client.post_like_many([ps.Like(str(i)) for i in range(30)], max_workers=4)
+        e = cm.exception
+
+        self.assertEqual(list(e.errors), [5])
+        self.assertEqual(sorted(set(e.responses) | set(e.errors)), sorted(sent))
+        self.assertEqual(sorted(list(e.responses) + list(e.errors) + e.cancelled), list(range(30)))
+        self.assertTrue(e.cancelled)
+        for i, resp in e.responses.items():
+            self.assertEqual(resp, f'media/{i}/like/')
+
+    def test_fill_on_calling_thread(self):
+        client = ApiClient(testing=True)
+        client._request = unittest.mock.Mock(return_value=Response())
+        threads = []
+        fill = ps.Like.fill
+
+        def record(obj, c):
+            threads.append(threading.current_thread())
+            return fill(obj, c)
+
+        with unittest.mock.patch.object(ps.Like, 'fill', autospec=True, side_effect=record):
+            client.post_like_many([ps.Like(str(i)) for i in range(8)], max_workers=4)
+        self.assertEqual(threads, [threading.current_thread()] * 8)
+
+    def test_challenge_handled_once(self):
+        client = ApiClient(testing=True)
+
+        def post(*args, **kwargs):
+            resp = Response()
+            resp.status_code = 400
+            resp._content = json.dumps({'message': 'challenge_required'}).encode()
+            resp.request = unittest.mock.Mock()
+            return resp
+
+        client._session = unittest.mock.Mock(cookies=client._session.cookies, post=post)
+        client._handle_challenge = unittest.mock.Mock(return_value=True)
+        with self.assertRaises(BulkActionFailed) as cm:
+            client.post_like_many([ps.Like(str(i)) for i in range(8)], max_workers=8)
+        client._handle_challenge.assert_called_once()
+        self.assertTrue(all(isinstance(e, ChallengeRequired) for e in cm.exception.errors.values()))
+
+
+class TestPostAct(unittest.TestCase):
+    def test_feed_position_is_kept(self):
+        client = ApiClient(testing=True)
+        client._request = unittest.mock.Mock(return_value=Response())
+        obj = ps.Like("test")
+
+        client._post_act(obj)
+        client._post_act(obj)
+
+        self.assertEqual(client._request.call_count, 2)
+        self.assertIn('feed_position', obj.__dict__)
+        for call in client._request.call_args_list:
+            self.assertNotIn('feed_position', call.kwargs['data'])
@@ -6,7 +6,10 @@ import requests
 import base64
 import time
 import json
+import threading
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from .structs import IGProfile, DeviceProfile, State
@@ -85,6 +88,11 @@ class ApiClient(ProfileMixin, AuthenticationMixin, PostMixin, RequestMixin, Frie
         self._user_name = user_name
 
         self._session = requests.Session()
+        # Keep connections to Instagram alive and pooled, so consecutive requests don't each pay for a new TCP and TLS
+        # handshake.
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.2))
+        self._session.mount('https://i.instagram.com', adapter)
+        self._session.mount('https://www.instagram.com', adapter)
         if session_cookies is not None:
             for k, v in session_cookies.items():
                 self._session.cookies.set_cookie(
@@ -100,6 +108,11 @@ class ApiClient(ProfileMixin, AuthenticationMixin, PostMixin, RequestMixin, Frie
 
         self._user_agent = self._build_user_agent()
         self._request_finished_callbacks = [self._update_state_from_headers]
+        # `post_like_many` sends requests from multiple threads. The lock makes sure that only one of them builds
+        # headers from, or updates, the state at a time. It does not cover the session: the requests.Session (and its
+        # cookie jar) is shared across those threads, without being guaranteed thread-safe.
+        self._state_lock = threading.RLock()
+        self._thread_local = threading.local()
 
         self.scheduler = BackgroundScheduler()
 
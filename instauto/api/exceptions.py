@@ -33,6 +33,25 @@ class BadResponse(Exception):
     pass
 
 
+class ChallengeRequired(BadResponse):
+    """Raised when Instagram asks for a challenge on a thread that should not handle it itself. The response that
+    contains the challenge is available as `resp`."""
+    def __init__(self, resp, *args):
+        super().__init__(*args)
+        self.resp = resp
+
+
+class BulkActionFailed(Exception):
+    """Raised when one or more requests of a bulk action fail. Contains the outcome of every item, by its index in
+    the list that was passed in: `responses` maps the items that succeeded to their response, `errors` maps the items
+    that failed to their exception, and `cancelled` lists the items that were never sent."""
+    def __init__(self, responses, errors, cancelled, *args):
+        super().__init__(*args)
+        self.responses = responses
+        self.errors = errors
+        self.cancelled = cancelled
+
+
 class MissingValue(Exception):
     """Raised when an action struct is initiated with a missing value"""
     pass